@@ -5,179 +5,612 @@ Enhanced with default readable mode for piped input
 """
 
 import argparse
+import concurrent.futures
+import contextlib
 import csv
+import functools
+import io
+import itertools
+import mmap
+import multiprocessing
 import sys
 import re
 import os
-from io import StringIO
+import queue
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+except ImportError:
+    pa = None
+
+try:
+    import re2  # type: ignore
+except ImportError:
+    re2 = None
+
+# Piped input larger than this is spooled to disk by the readable command
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Number of rows transposed at a time when computing readable column widths
+WIDTH_SCAN_BATCH = 4096
+
+# Size of the write buffer placed in front of stdout
+STDOUT_BUFFER_SIZE = 1 << 20
+
+# Chunk size and number of chunks buffered ahead by --async-io reads
+READ_AHEAD_CHUNK_SIZE = 1 << 20
+READ_AHEAD_DEPTH = 16
+
+# Files at least this large are searched on several processes
+PARALLEL_SEARCH_MIN_SIZE = 64 * 1024 * 1024
+PARALLEL_SEARCH_CHUNKS_PER_WORKER = 4
+
+# Search patterns without any of these characters are plain substrings
+REGEX_METACHARS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# A group followed by a quantifier, the usual cause of catastrophic backtracking
+QUANTIFIED_GROUP = re.compile(r'\)[*+{]')
+
+# Constructs that RE2 reads differently from the re module: its \w, \d, \s and
+# \b only cover ASCII, it folds case differently, it treats [[:alpha:]] as a
+# character class and it takes {,n} literally instead of as {0,n}
+RE2_INCOMPATIBLE = re.compile(r'\\[wWdDsSbB]|\(\?[a-zA-Z]*i|\[:|\{,')
+
+
+class _ReadAheadFile(io.RawIOBase):
+    """Raw reader that fetches the next chunks of a file on a background thread"""
+    # File reads release the GIL, so the disk is kept busy while the main
+    # thread parses the chunks that have already arrived
+    
+    def __init__(self, raw, chunk_size=READ_AHEAD_CHUNK_SIZE, depth=READ_AHEAD_DEPTH):
+        super().__init__()
+        self._raw = raw
+        self._chunk_size = chunk_size
+        self._chunks = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._pending = memoryview(b'')
+        # The last item from the reader thread: b'' at end of file, or the
+        # exception that stopped it
+        self._end = None
+        self._worker = threading.Thread(target=self._read_ahead, daemon=True)
+        self._worker.start()
+    
+    def _read_ahead(self):
+        end = b''
+        try:
+            while not self._stop.is_set():
+                chunk = self._raw.read(self._chunk_size)
+                if not chunk:
+                    break
+                self._put(chunk)
+        except BaseException as e:
+            end = e
+        finally:
+            # Always signal the end, so readinto never waits on a dead thread
+            self._put(end)
+    
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        if not self._pending:
+            if self._end is None:
+                chunk = self._chunks.get()
+                if isinstance(chunk, BaseException) or not chunk:
+                    self._end = chunk
+                else:
+                    self._pending = memoryview(chunk)
+            if self._end is not None:
+                if isinstance(self._end, BaseException):
+                    raise self._end
+                return 0
+        
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+    
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._worker.join()
+            self._raw.close()
+        super().close()
 
 
 class CSVTool:
-    def __init__(self):
+    def __init__(self) -> None:
         self.delimiter = ','
         self.quote_char = '"'
+        self.async_io = False
+        self._header_map: Dict[str, int] = {}
+        self._header_map_source: Optional[List[str]] = None
         
-    def read_csv(self, input_source, has_header=True):
-        """Read CSV data from file or stdin"""
+    def _iter_rows(self, input_source):
+        """Yield parsed rows one at a time from file, stdin or file object"""
         if isinstance(input_source, str):
             if input_source == '-':
-                content = sys.stdin.read()
+                yield from csv.reader(sys.stdin, delimiter=self.delimiter, quotechar=self.quote_char)
             else:
-                with open(input_source, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                if self.async_io:
+                    f = open_read_ahead(input_source)
+                else:
+                    f = open(input_source, 'r', encoding='utf-8', newline='')
+                with f:
+                    yield from csv.reader(f, delimiter=self.delimiter, quotechar=self.quote_char)
         else:
-            content = input_source.read()
-            
-        reader = csv.reader(StringIO(content), delimiter=self.delimiter, quotechar=self.quote_char)
-        rows = list(reader)
+            yield from csv.reader(input_source, delimiter=self.delimiter, quotechar=self.quote_char)
+
+    def read_csv(self, input_source, has_header=True):
+        """Read CSV data from file or stdin"""
+        # Rows are parsed lazily rather than loaded into memory
+        rows = self._iter_rows(input_source)
         
-        if has_header and rows:
-            return rows[0], rows[1:]
+        if has_header:
+            return next(rows, None), rows
         else:
             return None, rows
     
+    def _read_arrow(self, input_source, has_header=True):
+        """Open a CSV file as a stream of Arrow record batches, or return None to use read_csv"""
+        # Only regular files can be read a second time
+        if (pa is None or self.async_io or not isinstance(input_source, str)
+                or input_source == '-' or not os.path.isfile(input_source)):
+            return None
+        
+        rows = self._iter_rows(input_source)
+        first_row = next(rows, None)
+        rows.close()
+        if not first_row:
+            return None
+        
+        # skip_rows counts physical lines, so a header record spanning several
+        # lines cannot be skipped reliably
+        if has_header and any('\n' in cell or '\r' in cell for cell in first_row):
+            return None
+        
+        # Arrow drops a leading byte order mark that the csv module keeps as data
+        if not has_header and first_row[0].startswith('\ufeff'):
+            return None
+        
+        batches = self._iter_batches(input_source, len(first_row), has_header)
+        return (first_row if has_header else None), batches
+    
+    def _iter_batches(self, path, num_columns, has_header=True):
+        """Yield the record batches of a CSV file parsed by pyarrow, every column as strings"""
+        names = ['f%d' % i for i in range(num_columns)]
+        read_options = pacsv.ReadOptions(column_names=names, skip_rows=1 if has_header else 0)
+        parse_options = pacsv.ParseOptions(delimiter=self.delimiter, quote_char=self.quote_char,
+                                           newlines_in_values=True, ignore_empty_lines=False)
+        convert_options = pacsv.ConvertOptions(column_types={name: pa.string() for name in names},
+                                               strings_can_be_null=False,
+                                               quoted_strings_can_be_null=False)
+        with pa.OSFile(path) as source:
+            yield from pacsv.open_csv(source, read_options=read_options,
+                                      parse_options=parse_options, convert_options=convert_options)
+    
+    def _arrow_rows(self, input_source, batches, batch_rows, csv_rows, has_header=True):
+        """Yield the output rows of each Arrow batch, finishing with csv_rows if Arrow rejects a batch"""
+        done = 0
+        try:
+            for batch in batches:
+                yield from batch_rows(batch)
+                done += batch.num_rows
+        except pa.ArrowInvalid:
+            # Usually a row with the wrong number of cells, which the csv module
+            # accepts; carry on from the first record of the rejected batch
+            rows = self._iter_rows(input_source)
+            yield from csv_rows(itertools.islice(rows, done + (1 if has_header else 0), None))
+    
     def write_csv(self, headers, rows, output=None):
-        """Write CSV data to output"""
+        """Write CSV data to output (buffered stdout by default)"""
         if output is None:
-            output = sys.stdout
+            with buffered_stdout(newline='') as output:
+                self.write_csv(headers, rows, output)
+            return
             
         writer = csv.writer(output, delimiter=self.delimiter, quotechar=self.quote_char, quoting=csv.QUOTE_MINIMAL)
         
         if headers:
             writer.writerow(headers)
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
+    
+    def _scan_widths(self, input_source, no_header=False):
+        """Compute the display width of each column without keeping any rows"""
+        headers, rows = self.read_csv(input_source, has_header=not no_header)
+        
+        if not headers:
+            headers = next(rows, None)
+            if headers is None:
+                return None
+        widths = array('i', map(len, headers))
+        
+        # Transpose the rows in batches so the per-column max runs in C
+        num_columns = len(widths)
+        while True:
+            batch = list(itertools.islice(rows, WIDTH_SCAN_BATCH))
+            if not batch:
+                break
+            columns = itertools.zip_longest(*batch, fillvalue='')
+            for col_idx, column in enumerate(itertools.islice(columns, num_columns)):
+                width = max(map(len, column))
+                if width > widths[col_idx]:
+                    widths[col_idx] = width
+        return widths
     
     def readable(self, input_source, no_header=False):
         """Display CSV in readable format"""
+        # The input is read twice, for the widths and then for printing. Stdin,
+        # pipes and other special files can only be read once, so spool them.
+        if input_source == '-' or not os.path.isfile(input_source):
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+',
+                                               encoding='utf-8', newline='') as spool:
+                if input_source == '-':
+                    shutil.copyfileobj(sys.stdin, spool)
+                else:
+                    with open(input_source, 'r', encoding='utf-8', newline='') as f:
+                        shutil.copyfileobj(f, spool)
+                spool.seek(0)
+                widths = self._scan_widths(spool, no_header)
+                spool.seek(0)
+                self._print_readable(spool, widths, no_header)
+        else:
+            widths = self._scan_widths(input_source, no_header)
+            self._print_readable(input_source, widths, no_header)
+    
+    def _print_readable(self, input_source, widths, no_header=False):
+        """Print rows padded to the given column widths"""
+        if widths is None:
+            return
+        
         headers, rows = self.read_csv(input_source, has_header=not no_header)
         
-        if not rows and not headers:
-            return
-            
-        all_rows = []
-        if headers and not no_header:
-            all_rows.append(headers)
-        all_rows.extend(rows)
+        # Rows with exactly one cell per column are formatted in a single call
+        num_columns = len(widths)
+        row_format = ' | '.join('{:<%d}' % width for width in widths) + '\n'
         
-        if not all_rows:
-            return
-            
-        # Calculate column widths
-        widths = []
-        for col_idx in range(len(all_rows[0])):
-            max_width = 0
-            for row in all_rows:
-                if col_idx < len(row):
-                    max_width = max(max_width, len(str(row[col_idx])))
-            widths.append(max_width)
-        
-        # Print formatted output
-        for row_idx, row in enumerate(all_rows):
+        def format_ragged_row(row):
             formatted_row = []
             for col_idx, cell in enumerate(row):
-                if col_idx < len(widths):
-                    formatted_row.append(str(cell).ljust(widths[col_idx]))
+                if col_idx < num_columns:
+                    formatted_row.append(cell.ljust(widths[col_idx]))
                 else:
-                    formatted_row.append(str(cell))
-            print(' | '.join(formatted_row))
+                    formatted_row.append(cell)
+            return ' | '.join(formatted_row) + '\n'
+        
+        with buffered_stdout() as out:
+            write = out.write
+            
+            # Print header and separator
+            if headers:
+                write(format_ragged_row(headers))
+                write('-|-'.join('-' * width for width in widths) + '\n')
             
-            # Print separator after header
-            if row_idx == 0 and headers and not no_header:
-                separator = []
-                for width in widths:
-                    separator.append('-' * width)
-                print('-|-'.join(separator))
-    
-    def select_columns(self, input_source, columns, no_header=False):
+            for row in rows:
+                if len(row) == num_columns:
+                    write(row_format.format(*row))
+                else:
+                    write(format_ragged_row(row))
+    
+    def _resolve_column(self, headers: Optional[List[str]], column: str) -> Optional[int]:
+        """Convert a 1-based column number or a header name to a 0-based index"""
+        if column.isdigit():
+            return int(column) - 1
+        
+        # Names cannot be resolved without a header row
+        if not headers:
+            return None
+        
+        # Map each header name to its first position, once per header row
+        if self._header_map_source is not headers:
+            self._header_map = {}
+            for i, name in enumerate(headers):
+                self._header_map.setdefault(name, i)
+            self._header_map_source = headers
+        
+        try:
+            return self._header_map[column]
+        except KeyError:
+            print(f"Column '{column}' not found", file=sys.stderr)
+            sys.exit(1)
+    
+    def select_columns(self, input_source, columns: str, no_header: bool = False) -> None:
         """Select specific columns"""
-        headers, rows = self.read_csv(input_source, has_header=not no_header)
+        arrow = self._read_arrow(input_source, has_header=not no_header)
+        if arrow is not None:
+            headers, batches = arrow
+        else:
+            headers, rows = self.read_csv(input_source, has_header=not no_header)
         
-        # Parse column indices
-        col_indices = []
+        # Parse column indices; names are skipped when there is no header row
+        col_indices: List[int] = []
         for col in columns.split(','):
-            col = col.strip()
-            if col.isdigit():
-                col_indices.append(int(col) - 1)  # Convert to 0-based index
-            else:
-                # Handle column names
-                if headers:
-                    try:
-                        col_indices.append(headers.index(col))
-                    except ValueError:
-                        print(f"Column '{col}' not found", file=sys.stderr)
-                        sys.exit(1)
+            col_index = self._resolve_column(headers, col.strip())
+            if col_index is not None:
+                col_indices.append(col_index)
         
         # Select columns from headers
         new_headers = None
         if headers and not no_header:
             new_headers = [headers[i] for i in col_indices if i < len(headers)]
         
-        # Select columns from rows
-        new_rows = []
-        for row in rows:
-            new_row = []
-            for i in col_indices:
-                if i < len(row):
-                    new_row.append(row[i])
-                else:
-                    new_row.append('')
-            new_rows.append(new_row)
+        # With no columns left every output record is empty, which Arrow
+        # batches cannot represent
+        if arrow is not None and not col_indices:
+            batches.close()
+            arrow = None
+            _, rows = self.read_csv(input_source, has_header=not no_header)
         
-        self.write_csv(new_headers, new_rows)
+        project = _compile_projection(col_indices)
+        if arrow is not None:
+            rows = self._arrow_rows(input_source, batches,
+                                    functools.partial(_project_batch, col_indices=col_indices),
+                                    functools.partial(map, project), has_header=not no_header)
+            self.write_csv(new_headers, rows)
+            return
+        
+        # Select columns from rows
+        self.write_csv(new_headers, map(project, rows))
     
-    def search(self, input_source, column, pattern, no_header=False):
+    def search(self, input_source, column: str, pattern: str, no_header: bool = False) -> None:
         """Search for pattern in specified column"""
-        headers, rows = self.read_csv(input_source, has_header=not no_header)
+        # Plain literals use a substring test instead of the regex engine.
+        # Only those go through Arrow: its regex kernel uses RE2, whose \w, \d,
+        # \s and \b match ASCII only where the re module matches Unicode.
+        # An empty pattern stays off Arrow too, which reads blank lines as
+        # empty cells that it would match.
+        literal = not REGEX_METACHARS.search(pattern)
+        arrow = self._read_arrow(input_source, has_header=not no_header) if literal and pattern else None
+        if arrow is not None:
+            headers, batches = arrow
+        else:
+            headers, rows = self.read_csv(input_source, has_header=not no_header)
         
         # Parse column index
-        if column.isdigit():
-            col_index = int(column) - 1
-        else:
-            if headers:
-                try:
-                    col_index = headers.index(column)
-                except ValueError:
-                    print(f"Column '{column}' not found", file=sys.stderr)
-                    sys.exit(1)
-            else:
-                print("Cannot use column name without headers", file=sys.stderr)
+        col_index = self._resolve_column(headers, column)
+        if col_index is None:
+            print("Cannot use column name without headers", file=sys.stderr)
+            sys.exit(1)
+        
+        if not literal:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                print(f"Invalid search pattern '{pattern}': {e}", file=sys.stderr)
                 sys.exit(1)
         
+        if arrow is not None:
+            filtered_rows = self._arrow_rows(
+                input_source, batches,
+                functools.partial(_filter_batch, col_index=col_index, pattern=pattern),
+                functools.partial(_filter_rows, col_index=col_index, pattern=pattern, literal=True),
+                has_header=not no_header)
+            self.write_csv(headers if not no_header else None, filtered_rows)
+            return
+        
+        chunks = self._split_for_search(input_source, has_header=not no_header)
+        if chunks is not None:
+            # Workers reopen the file themselves; close ours (and any
+            # read-ahead thread) before the pool forks
+            rows.close()
+            filtered_rows = self._search_parallel(input_source, chunks, col_index, pattern, literal)
+            self.write_csv(headers if not no_header else None, filtered_rows)
+            return
+        
         # Filter rows
-        filtered_rows = []
-        for row in rows:
-            if col_index < len(row):
-                if re.search(pattern, str(row[col_index])):
-                    filtered_rows.append(row)
+        filtered_rows = _filter_rows(rows, col_index, pattern, literal)
         
         self.write_csv(headers if not no_header else None, filtered_rows)
     
-    def replace(self, input_source, column, old_value, new_value, no_header=False):
+    def _split_for_search(self, input_source, has_header=True):
+        """Split a large file into (start, end) byte ranges that hold whole rows, or return None"""
+        if not isinstance(input_source, str) or input_source == '-':
+            return None
+        
+        workers = os.cpu_count() or 1
+        size = os.path.getsize(input_source)
+        if workers < 2 or size < PARALLEL_SEARCH_MIN_SIZE:
+            return None
+        
+        with open(input_source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A quoted field may span lines, so only unquoted files can be
+            # split at newlines
+            if mm.find(self.quote_char.encode('utf-8')) != -1:
+                return None
+            
+            start = 0
+            if has_header:
+                start = mm.find(b'\n') + 1
+                if start == 0:
+                    return None
+            
+            chunk_size = max(1, (size - start) // (workers * PARALLEL_SEARCH_CHUNKS_PER_WORKER))
+            chunks = []
+            while start < size:
+                end = mm.find(b'\n', start + chunk_size)
+                end = size if end == -1 else end + 1
+                chunks.append((start, end))
+                start = end
+        return chunks
+    
+    def _search_parallel(self, path, chunks, col_index, pattern, literal):
+        """Search the given byte ranges of a file on a process pool, yielding matches in file order"""
+        context = None
+        if sys.platform.startswith('linux'):
+            context = multiprocessing.get_context('fork')
+        
+        search_chunk = functools.partial(_search_chunk, path, col_index=col_index, pattern=pattern,
+                                         literal=literal, delimiter=self.delimiter,
+                                         quote_char=self.quote_char, parent_pid=os.getpid())
+        with concurrent.futures.ProcessPoolExecutor(mp_context=context) as executor:
+            for matches in executor.map(search_chunk, chunks):
+                yield from matches
+    
+    def replace(self, input_source, column: str, old_value: str, new_value: str,
+                no_header: bool = False) -> None:
         """Replace values in specified column"""
         headers, rows = self.read_csv(input_source, has_header=not no_header)
         
         # Parse column index
-        if column.isdigit():
-            col_index = int(column) - 1
-        else:
-            if headers:
-                try:
-                    col_index = headers.index(column)
-                except ValueError:
-                    print(f"Column '{column}' not found", file=sys.stderr)
-                    sys.exit(1)
-            else:
-                print("Cannot use column name without headers", file=sys.stderr)
-                sys.exit(1)
+        col_index = self._resolve_column(headers, column)
+        if col_index is None:
+            print("Cannot use column name without headers", file=sys.stderr)
+            sys.exit(1)
         
         # Replace values
-        for row in rows:
-            if col_index < len(row):
-                if str(row[col_index]) == old_value:
-                    row[col_index] = new_value
+        def replaced_rows() -> Iterator[List[str]]:
+            ci, ov, nv = col_index, old_value, new_value
+            for row in rows:
+                if len(row) > ci and row[ci] == ov:
+                    row[ci] = nv
+                yield row
         
-        self.write_csv(headers if not no_header else None, rows)
+        self.write_csv(headers if not no_header else None, replaced_rows())
+
+
+def _compile_projection(col_indices: List[int]) -> Callable[[List[str]], List[str]]:
+    """Generate a function that returns the cells at col_indices from a row"""
+    # The indices are written into the function as constants instead of being
+    # looped over for every row; cells missing from short rows become ''
+    cells = ', '.join("r[%d] if n > %d else ''" % (i, i) for i in col_indices)
+    namespace: Dict[str, Any] = {}
+    exec('def project(r):\n    n = len(r)\n    return [%s]\n' % cells, namespace)
+    return namespace['project']
+
+
+def _compile_search(pattern):
+    """Return the search method of a compiled regex for pattern"""
+    # A quantified group such as '^(a+)+$' can make re backtrack exponentially,
+    # so those go to RE2's linear-time matcher; re is faster for the rest
+    if (re2 is not None and QUANTIFIED_GROUP.search(pattern)
+            and not RE2_INCOMPATIBLE.search(pattern)):
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            fast_search = re2.compile(pattern, options).search
+        except re2.error:
+            pass
+        else:
+            if '$' not in pattern:
+                return fast_search
+            
+            # re lets $ match before a trailing newline, RE2 does not
+            slow_search = re.compile(pattern).search
+            
+            def search(value):
+                if value.endswith('\n'):
+                    return slow_search(value)
+                return fast_search(value)
+            return search
+    return re.compile(pattern).search
+
+
+def _filter_rows(rows, col_index, pattern, literal=False):
+    """Yield the rows whose column matches pattern"""
+    if literal:
+        return (row for row in rows
+                if col_index < len(row) and pattern in row[col_index])
+    
+    _search = _compile_search(pattern)
+    return (row for row in rows
+            if col_index < len(row) and _search(row[col_index]))
+
+
+# Set in a worker process once it is watching for its parent to go away
+_watching_parent = False
+
+
+def _exit_with_parent(parent_pid):
+    """Stop the current worker process once its parent is gone"""
+    # The parent may be killed by SIGPIPE (e.g. "csvtool search ... | head")
+    # before it can shut the pool down, which would leave idle workers behind
+    global _watching_parent
+    if _watching_parent:
+        return
+    _watching_parent = True
+    
+    def watch():
+        while os.getppid() == parent_pid:
+            time.sleep(1)
+        os._exit(1)
+    
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def _search_chunk(path, chunk, col_index, pattern, literal, delimiter, quote_char, parent_pid):
+    """Return the matching rows from one byte range of a file (runs in a worker process)"""
+    _exit_with_parent(parent_pid)
+    
+    start, end = chunk
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    
+    rows = csv.reader(io.StringIO(data.decode('utf-8'), newline=''),
+                      delimiter=delimiter, quotechar=quote_char)
+    return list(_filter_rows(rows, col_index, pattern, literal))
+
+
+def _batch_rows(batch):
+    """Iterate over the rows of an Arrow record batch as tuples of strings"""
+    return zip(*(column.to_pylist() for column in batch.columns))
+
+
+def _project_batch(batch, col_indices):
+    """Return the cells at col_indices from each row of a record batch"""
+    empty = [''] * batch.num_rows
+    return zip(*(batch.column(i).to_pylist() if i < batch.num_columns else empty
+                 for i in col_indices))
+
+
+def _filter_batch(batch, col_index, pattern):
+    """Return the rows of a record batch whose column contains the literal pattern"""
+    if col_index >= batch.num_columns:
+        return iter(())
+    return _batch_rows(batch.filter(pc.match_substring(batch.column(col_index), pattern)))
+
+
+@contextlib.contextmanager
+def buffered_stdout(newline=None):
+    """Yield a text stream that writes to stdout through a large buffer"""
+    if not hasattr(sys.stdout, 'buffer'):
+        yield sys.stdout
+        return
+    
+    sys.stdout.flush()
+    buffer = io.BufferedWriter(sys.stdout.buffer, buffer_size=STDOUT_BUFFER_SIZE)
+    out = io.TextIOWrapper(buffer, encoding=sys.stdout.encoding, errors=sys.stdout.errors,
+                           newline=newline, write_through=False)
+    try:
+        yield out
+    finally:
+        # Flush, but leave stdout itself open for later writes
+        out.flush()
+        out.detach()
+        buffer.detach()
+
+
+def open_read_ahead(path):
+    """Open a UTF-8 text file whose contents are read ahead on a background thread"""
+    raw = _ReadAheadFile(open(path, 'rb', buffering=0))
+    return io.TextIOWrapper(io.BufferedReader(raw), encoding='utf-8', newline='')
 
 
 def is_piped_input():
@@ -186,6 +619,11 @@ def is_piped_input():
 
 
 def main():
+    # Let the default SIGPIPE action end the process quietly when the reader
+    # of our output goes away (e.g. "csvtool ... | head")
+    if hasattr(signal, 'SIGPIPE'):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    
     parser = argparse.ArgumentParser(
         description='CSV manipulation tool with default readable mode for piped input',
         prog='csvtool'
@@ -193,9 +631,13 @@ def main():
     
     # Check for default behavior (no arguments + piped input)
     if len(sys.argv) == 1 and is_piped_input():
-        # Default behavior: readable mode from stdin
-        tool = CSVTool()
-        tool.readable('-')
+        if sys.stdout.isatty():
+            # Default behavior: readable mode from stdin
+            tool = CSVTool()
+            tool.readable('-')
+        else:
+            # Output is going to another program, so pass the CSV through as is
+            shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)
         return
     
     # Global options
@@ -203,6 +645,8 @@ def main():
                        help='Treat first row as data, not header')
     parser.add_argument('--delimiter', '-d', default=',',
                        help='Field delimiter (default: comma)')
+    parser.add_argument('--async-io', action='store_true',
+                       help='Read input files ahead on a background thread')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -249,6 +693,7 @@ def main():
     # Initialize tool
     tool = CSVTool()
     tool.delimiter = args.delimiter
+    tool.async_io = args.async_io
     
     # Execute command
     if args.command == 'readable':
@@ -270,7 +715,8 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         sys.exit(1)
     except BrokenPipeError:
-        # Handle broken pipe gracefully
+        # Only reached on platforms without SIGPIPE (see main). Point stdout at
+        # devnull so the interpreter's final flush does not fail again.
         devnull = os.open(os.devnull, os.O_WRONLY)
         os.dup2(devnull, sys.stdout.fileno())
         sys.exit(1)
@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Set CSVTOOL_USE_MYPYC=1 to compile csvtool/csvtool.py into a C extension with
+# mypyc. The pure Python module is used whenever the extension is not built.
+ext_modules = []
+if os.environ.get("CSVTOOL_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["csvtool/csvtool.py"])
+
 setup(
     name="csvtool",
     version="1.3.0",
@@ -15,6 +24,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/maroofi/csvtool",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -33,6 +43,9 @@ setup(
         "Topic :: Utilities",
     ],
     python_requires=">=3.6",
+    extras_require={
+        "fast": ["pyarrow", "google-re2"],
+    },
     entry_points={
         "console_scripts": [
             "csvtool=csvtool.__main__:main",